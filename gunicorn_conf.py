@@ -0,0 +1,53 @@
+"""
+Gunicorn config for RealTime Prague Tour.
+
+  gunicorn -c gunicorn_conf.py realtimepythonweb:app
+
+The app is I/O bound (Postgres queries, photo uploads), so it runs on
+gevent workers: each worker serves many requests as cheap greenlets.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+
+worker_class = "gevent"
+worker_connections = 1000
+
+# Workers split DB_MAX_CONNECTIONS between them and each needs at least 2
+# (see SQLALCHEMY_ENGINE_OPTIONS in the app), which also caps the default
+# (cpu_count() sees all host CPUs, even in a container).
+db_max_connections = int(os.environ.get("DB_MAX_CONNECTIONS", 90))
+workers = int(os.environ.get(
+    "WEB_CONCURRENCY",
+    min(multiprocessing.cpu_count() * 2 + 1, db_max_connections // 2),
+))
+
+timeout = 60
+
+
+def on_starting(server):
+    # Cached data (route steps, user records) is invalidated with
+    # cache.delete_memoized(); without Redis each worker has its own
+    # in-process cache, so that would only reach the worker that handled
+    # the change and the others would serve stale game state.
+    if server.cfg.workers > 1 and not os.environ.get("REDIS_URL"):
+        raise SystemExit(
+            "REDIS_URL must be set when running more than one worker "
+            "(or run a single worker: WEB_CONCURRENCY=1)"
+        )
+    if server.cfg.workers * 2 > db_max_connections:
+        raise SystemExit(
+            f"{server.cfg.workers} workers need at least {server.cfg.workers * 2} "
+            f"DB connections; DB_MAX_CONNECTIONS is {db_max_connections}"
+        )
+    # The final count (after -w / WEB_CONCURRENCY): workers inherit it and
+    # the app sizes its connection pool from it
+    os.environ["WEB_CONCURRENCY"] = str(server.cfg.workers)
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension; make its socket waits yield to other greenlets
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()